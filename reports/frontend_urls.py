@@ -9,6 +9,7 @@ urlpatterns = [
     
     # API endpoints for frontend
     path('api/register/', frontend_views.register_api, name='register_api'),
+    path('api/register/bulk/', frontend_views.bulk_register_api, name='bulk_register_api'),
     path('api/user/profile/', frontend_views.user_profile_api, name='user_profile'),
     path('api/auth/status/', frontend_views.auth_status, name='auth_status'),
     path('auth/session-login/', frontend_views.session_login, name='session_login'),
@@ -2,6 +2,8 @@ from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import logout as auth_logout, authenticate, login
 from django.http import JsonResponse
+from django.urls import reverse_lazy
+from django.utils.http import quote_etag, parse_etags
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from rest_framework.decorators import api_view, permission_classes
@@ -9,20 +11,57 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth import get_user_model
-from .serializers import UserSerializer
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from .serializers import UserSerializer, RegistrationSerializer, user_to_dict
+from .permissions import user_is_admin, IsAdminUser
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+import hashlib
 import json
 
 User = get_user_model()
 
+ADMIN_DASHBOARD_URL = reverse_lazy('admin_dashboard')
+CITIZEN_DASHBOARD_URL = reverse_lazy('citizen_dashboard')
+
+
+def _role_required(admin, redirect_url):
+    """Redirect users whose role doesn't match to redirect_url, using the shared per-request role check"""
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            if user_is_admin(request) != admin:
+                return redirect(redirect_url)
+            return view_func(request, *args, **kwargs)
+        return _wrapped_view
+    return decorator
+
+
+# Send users who open the other role's pages to their own dashboard
+citizen_only = _role_required(False, ADMIN_DASHBOARD_URL)
+admin_only = _role_required(True, CITIZEN_DASHBOARD_URL)
+
+
+def _user_etag(user):
+    """Build an ETag from every field exposed by UserSerializer"""
+    fingerprint = ':'.join(str(getattr(user, field)) for field in UserSerializer.Meta.fields)
+    return quote_etag(hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest())
+
+
+def _etag_matches(request, etag):
+    """Check whether the client already holds the current representation"""
+    return etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+
 
 # Authentication Views
 def login_view(request):
     """Render login page"""
     if request.user.is_authenticated:
-        if request.user.is_admin():
-            return redirect('/management/dashboard/')
+        if user_is_admin(request):
+            return redirect(ADMIN_DASHBOARD_URL)
         else:
-            return redirect('/citizen/dashboard/')
+            return redirect(CITIZEN_DASHBOARD_URL)
     return render(request, 'auth/login.html')
 
 
@@ -37,22 +76,37 @@ def register_view(request):
 @permission_classes([AllowAny])
 def register_api(request):
     """API endpoint for user registration"""
-    data = request.data.copy()
-    data['role'] = 'citizen'  # Force citizen role for public registration
+    serializer = RegistrationSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+    return Response({'message': 'User created successfully'}, status=status.HTTP_201_CREATED)
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def bulk_register_api(request):
+    """API endpoint for admins to register a list of citizens at once"""
+    serializer = RegistrationSerializer(data=request.data, many=True)
+    serializer.is_valid(raise_exception=True)
+    accounts = serializer.validated_data
     
-    serializer = UserSerializer(data=data)
-    if serializer.is_valid():
-        user = User.objects.create_user(
-            username=data['username'],
-            email=data['email'],
-            password=data['password'],
-            first_name=data.get('first_name', ''),
-            last_name=data.get('last_name', ''),
-            phone_number=data.get('phone_number', ''),
-            role='citizen'
-        )
-        return Response({'message': 'User created successfully'}, status=status.HTTP_201_CREATED)
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    # Hash passwords in parallel; PBKDF2 releases the GIL while hashing
+    passwords = [account.pop('password') for account in accounts]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        hashed_passwords = list(executor.map(make_password, passwords))
+    
+    # Usernames and emails arrive normalized by RegistrationSerializer, as create_user would store them
+    users = [
+        User(**account, password=hashed_password, role=User.CITIZEN)
+        for account, hashed_password in zip(accounts, hashed_passwords)
+    ]
+    try:
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=500)
+    except IntegrityError:
+        # A username was taken between validation and insert; nothing was created
+        return Response({'error': 'One or more usernames already exist'}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'message': 'Users created successfully', 'count': len(users)}, status=status.HTTP_201_CREATED)
 
 
 @api_view(['GET'])
@@ -61,8 +115,11 @@ def user_profile_api(request):
     if not request.user.is_authenticated:
         return Response({'error': 'Not authenticated'}, status=status.HTTP_401_UNAUTHORIZED)
     
-    serializer = UserSerializer(request.user)
-    return Response(serializer.data)
+    etag = _user_etag(request.user)
+    if _etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    
+    return Response(user_to_dict(request.user), headers={'ETag': etag})
 
 
 def logout_view(request):
@@ -75,67 +132,61 @@ def logout_view(request):
 @login_required
 def home_view(request):
     """Redirect to appropriate dashboard based on user role"""
-    if request.user.is_admin():
-        return redirect('/management/dashboard/')
+    if user_is_admin(request):
+        return redirect(ADMIN_DASHBOARD_URL)
     else:
-        return redirect('/citizen/dashboard/')
+        return redirect(CITIZEN_DASHBOARD_URL)
 
 
 @login_required
+@citizen_only
 def citizen_dashboard(request):
     """Citizen dashboard - shows user's reports"""
-    if request.user.is_admin():
-        return redirect('/management/dashboard/')
     return render(request, 'citizen/dashboard.html', {
         'user': request.user
     })
 
 
 @login_required
+@citizen_only
 def citizen_submit_report(request):
     """Citizen report submission form"""
-    if request.user.is_admin():
-        return redirect('/management/dashboard/')
     return render(request, 'citizen/submit_report.html', {
         'user': request.user
     })
 
 
 @login_required
+@admin_only
 def admin_dashboard(request):
     """Admin dashboard - overview of all reports"""
-    if not request.user.is_admin():
-        return redirect('/citizen/dashboard/')
     return render(request, 'admin/dashboard.html', {
         'user': request.user
     })
 
 
 @login_required
+@admin_only
 def admin_reports(request):
     """Admin reports management page"""
-    if not request.user.is_admin():
-        return redirect('/citizen/dashboard/')
     return render(request, 'admin/reports.html', {
         'user': request.user
     })
 
 
 @login_required
+@admin_only
 def admin_analytics(request):
     """Admin analytics dashboard"""
-    if not request.user.is_admin():
-        return redirect('/citizen/dashboard/')
     return render(request, 'admin/analytics.html', {
         'user': request.user
     })
 
 
 @login_required
+@admin_only
 def admin_map_view(request):
     """Admin map view of all reports"""
-    if not request.user.is_admin():
-        return redirect('/citizen/dashboard/')
     return render(request, 'admin/map.html', {
         'user': request.user
     })
@@ -147,8 +198,8 @@ def admin_map_view(request):
 def session_login(request):
     """Session-based login endpoint for template views"""
     try:
-        data = json.loads(request.body or '{}')
-    except Exception:
+        data = json.loads(request.body or b'{}')
+    except ValueError:
         return JsonResponse({'detail': 'Invalid JSON'}, status=400)
     
     user = authenticate(request, username=data.get('username'), password=data.get('password'))
@@ -156,16 +207,18 @@ def session_login(request):
         return JsonResponse({'detail': 'Invalid credentials'}, status=400)
     
     login(request, user)
-    role = getattr(user, 'role', 'citizen')
-    return JsonResponse({'ok': True, 'role': role})
+    return JsonResponse({'ok': True, 'role': user.role})
 
 
 @api_view(['GET'])
 def auth_status(request):
     """Check authentication status"""
     if request.user.is_authenticated:
+        etag = _user_etag(request.user)
+        if _etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
         return Response({
             'authenticated': True,
-            'user': UserSerializer(request.user).data
-        })
+            'user': user_to_dict(request.user)
+        }, headers={'ETag': etag})
     return Response({'authenticated': False})
\ No newline at end of file
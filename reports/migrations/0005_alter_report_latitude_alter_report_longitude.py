@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:52
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0004_alter_report_latitude_alter_report_longitude'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='report',
+            name='latitude',
+            field=models.FloatField(help_text='Latitude coordinate (-90 to 90)', validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)]),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='longitude',
+            field=models.FloatField(help_text='Longitude coordinate (-180 to 180)', validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)]),
+        ),
+    ]
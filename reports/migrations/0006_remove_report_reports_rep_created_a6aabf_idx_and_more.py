@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0005_alter_report_latitude_alter_report_longitude'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='report',
+            name='reports_rep_created_a6aabf_idx',
+        ),
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(condition=models.Q(('status__in', ['submitted', 'in_progress'])), fields=['status', '-created_at'], name='report_status_created_idx'),
+        ),
+    ]
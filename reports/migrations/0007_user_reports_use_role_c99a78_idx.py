@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('reports', '0006_remove_report_reports_rep_created_a6aabf_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role'], name='reports_use_role_c99a78_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0007_user_reports_use_role_c99a78_idx'),
+    ]
+
+    operations = [
+        migrations.RenameIndex(
+            model_name='report',
+            new_name='report_latlng_idx',
+            old_name='reports_rep_latitud_bfcbfa_idx',
+        ),
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['-created_at'], name='report_created_desc_idx'),
+        ),
+    ]
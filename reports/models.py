@@ -5,24 +5,34 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 
 class User(AbstractUser):
     """Extended User model with role-based permissions"""
+    CITIZEN = 'citizen'
+    ADMIN = 'admin'
     ROLE_CHOICES = [
-        ('citizen', 'Citizen'),
-        ('admin', 'Admin'),
+        (CITIZEN, 'Citizen'),
+        (ADMIN, 'Admin'),
     ]
     
     role = models.CharField(
         max_length=10, 
         choices=ROLE_CHOICES, 
-        default='citizen',
+        default=CITIZEN,
         help_text="User role for permission management"
     )
     phone_number = models.CharField(max_length=15, blank=True, null=True)
     
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['role']),
+        ]
+    
+    def get_role_display(self):
+        return ROLE_MAP.get(self.role, self.role)
+    
     def is_admin(self):
-        return self.role == 'admin'
+        return self.role == self.ADMIN
     
     def is_citizen(self):
-        return self.role == 'citizen'
+        return self.role == self.CITIZEN
 
 
 class Department(models.Model):
@@ -39,6 +49,15 @@ class Department(models.Model):
         return self.name
 
 
+class ReportManager(models.Manager):
+    """Default manager that joins the related users and department up front"""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'reported_by', 'assigned_department', 'assigned_to'
+        )
+
+
 class Report(models.Model):
     """Civic issue reports submitted by citizens"""
     
@@ -59,21 +78,24 @@ class Report(models.Model):
         ('rejected', 'Rejected'),
     ]
     
+    PRIORITY_CHOICES = [
+        ('low', 'Low'),
+        ('medium', 'Medium'),
+        ('high', 'High'),
+        ('urgent', 'Urgent'),
+    ]
+    
     # Basic information
     title = models.CharField(max_length=200)
     description = models.TextField()
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     
     # Location data
-    latitude = models.DecimalField(
-        max_digits=18, 
-        decimal_places=15,
+    latitude = models.FloatField(
         validators=[MinValueValidator(-90), MaxValueValidator(90)],
         help_text="Latitude coordinate (-90 to 90)"
     )
-    longitude = models.DecimalField(
-        max_digits=18, 
-        decimal_places=15,
+    longitude = models.FloatField(
         validators=[MinValueValidator(-180), MaxValueValidator(180)],
         help_text="Longitude coordinate (-180 to 180)"
     )
@@ -113,7 +135,7 @@ class Report(models.Model):
         null=True,
         blank=True,
         related_name='assigned_reports',
-        limit_choices_to={'role': 'admin'}
+        limit_choices_to={'role': User.ADMIN}
     )
     
     # Timestamps
@@ -124,30 +146,44 @@ class Report(models.Model):
     # Additional metadata
     priority = models.CharField(
         max_length=10,
-        choices=[
-            ('low', 'Low'),
-            ('medium', 'Medium'),
-            ('high', 'High'),
-            ('urgent', 'Urgent'),
-        ],
+        choices=PRIORITY_CHOICES,
         default='medium'
     )
     
+    objects = ReportManager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['status', 'category']),
-            models.Index(fields=['created_at']),
-            models.Index(fields=['latitude', 'longitude']),
+            models.Index(fields=['latitude', 'longitude'], name='report_latlng_idx'),
+            models.Index(fields=['-created_at'], name='report_created_desc_idx'),
+            # Serves the default newest-first ordering for open reports
+            models.Index(
+                fields=['status', '-created_at'],
+                name='report_status_created_idx',
+                condition=models.Q(status__in=['submitted', 'in_progress']),
+            ),
         ]
     
     def __str__(self):
         return f"{self.title} - {self.get_status_display()}"
     
+    # Label lookups via the precomputed maps below; Django's generated
+    # get_FOO_display() rebuilds a dict from the choices on every call
+    def get_category_display(self):
+        return CATEGORY_MAP.get(self.category, self.category)
+    
+    def get_status_display(self):
+        return STATUS_MAP.get(self.status, self.status)
+    
+    def get_priority_display(self):
+        return PRIORITY_MAP.get(self.priority, self.priority)
+    
     @property
     def location_coordinates(self):
         """Returns coordinates as a tuple"""
-        return (float(self.latitude), float(self.longitude))
+        return (self.latitude, self.longitude)
     
     def mark_resolved(self):
         """Mark report as resolved and set resolved timestamp"""
@@ -160,3 +196,10 @@ class Report(models.Model):
         """Calculate days since report was submitted"""
         from django.utils import timezone
         return (timezone.now() - self.created_at).days
+
+
+# Choice value -> label maps, built once at import
+ROLE_MAP = dict(User.ROLE_CHOICES)
+CATEGORY_MAP = dict(Report.CATEGORY_CHOICES)
+STATUS_MAP = dict(Report.STATUS_CHOICES)
+PRIORITY_MAP = dict(Report.PRIORITY_CHOICES)
@@ -1,11 +1,22 @@
 from rest_framework import permissions
 
+SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
+
+def user_is_admin(request):
+    """Return whether the request's user is an admin, resolving the role once per request"""
+    is_admin = getattr(request, '_cached_is_admin', None)
+    if is_admin is None:
+        user = request.user
+        is_admin = bool(user and user.is_authenticated and user.is_admin())
+        request._cached_is_admin = is_admin
+    return is_admin
 
 class IsAdminUser(permissions.BasePermission):
     """Permission class that only allows admin users"""
     
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.is_admin()
+        return user_is_admin(request)
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
@@ -16,7 +27,7 @@ class IsOwnerOrAdmin(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Admin users can access any object
-        if request.user.is_admin():
+        if user_is_admin(request):
             return True
         
         # For Report objects, check if user is the reporter
@@ -34,7 +45,7 @@ class IsCitizenOrAdmin(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            (request.user.is_citizen() or request.user.is_admin())
+            (request.user.is_citizen() or user_is_admin(request))
         )
 
 
@@ -43,12 +54,9 @@ class IsAdminOrReadOnly(permissions.BasePermission):
     but write access only to admin users"""
     
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        
-        # Read permissions for authenticated users
-        if request.method in permissions.SAFE_METHODS:
-            return True
-        
-        # Write permissions only for admin users
-        return request.user.is_admin()
\ No newline at end of file
+        # Reads for any authenticated user, writes only for admin users
+        return bool(
+            request.user and
+            request.user.is_authenticated and
+            (request.method in SAFE_METHODS or user_is_admin(request))
+        )
\ No newline at end of file
@@ -1,3 +1,6 @@
+import copy
+
+from django.conf import settings
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from .models import Report, Department
@@ -5,6 +8,14 @@ from .models import Report, Department
 User = get_user_model()
 
 
+def days_since_submitted(report):
+    """Day count from the SQL-annotated age, falling back to the model method"""
+    age = getattr(report, 'submitted_age', None)
+    if age is None:
+        return report.days_since_submitted()
+    return age.days
+
+
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for User model with role information"""
     
@@ -14,6 +25,78 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'date_joined']
 
 
+_date_joined_field = serializers.DateTimeField()
+
+
+def user_to_dict(user):
+    """Plain-dict equivalent of UserSerializer(user).data for hot read paths"""
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'role': user.role,
+        'phone_number': user.phone_number,
+        'date_joined': _date_joined_field.to_representation(user.date_joined),
+    }
+
+
+class UserLiteSerializer(serializers.ModelSerializer):
+    """Compact user representation for embedding in report details"""
+    
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'first_name', 'last_name', 'role']
+        read_only_fields = fields
+
+
+class RegistrationListSerializer(serializers.ListSerializer):
+    """List serializer for bulk registration that rejects repeated usernames"""
+    
+    def validate(self, attrs):
+        # UniqueValidator only checks the database, not the rest of the payload
+        seen = set()
+        duplicates = set()
+        for account in attrs:
+            username = account['username']
+            if username in seen:
+                duplicates.add(username)
+            seen.add(username)
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Duplicate usernames in request: {', '.join(sorted(duplicates))}"
+            )
+        return attrs
+
+
+class RegistrationSerializer(serializers.ModelSerializer):
+    """Serializer for public citizen registration"""
+    
+    class Meta:
+        model = User
+        fields = ['username', 'email', 'password', 'first_name', 'last_name', 'phone_number']
+        extra_kwargs = {
+            'password': {'write_only': True},
+            'email': {'required': True},
+        }
+        list_serializer_class = RegistrationListSerializer
+    
+    def validate_username(self, value):
+        # Match create_user's NFKC normalization so lookalike usernames collide
+        username = User.normalize_username(value)
+        if username != value and User.objects.filter(username=username).exists():
+            raise serializers.ValidationError("A user with that username already exists.")
+        return username
+    
+    def validate_email(self, value):
+        return User.objects.normalize_email(value)
+    
+    def create(self, validated_data):
+        # Public registration always creates citizens
+        return User.objects.create_user(**validated_data, role=User.CITIZEN)
+
+
 class DepartmentSerializer(serializers.ModelSerializer):
     """Serializer for Department model"""
     
@@ -23,16 +106,24 @@ class DepartmentSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class ReportListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for report listing"""
-    reported_by = serializers.StringRelatedField()
-    assigned_department = serializers.StringRelatedField()
-    assigned_to = serializers.StringRelatedField()
+class ReportDisplayFieldsMixin(serializers.Serializer):
+    """Computed read-only fields shared by the report list and detail serializers"""
     category_display = serializers.CharField(source='get_category_display', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     priority_display = serializers.CharField(source='get_priority_display', read_only=True)
-    days_since_submitted = serializers.IntegerField(read_only=True)
+    days_since_submitted = serializers.SerializerMethodField()
+    
+    def get_days_since_submitted(self, obj):
+        return days_since_submitted(obj)
+
+
+class ReportListSerializer(ReportDisplayFieldsMixin, serializers.ModelSerializer):
+    """Lightweight serializer for report listing"""
+    reported_by = serializers.CharField(source='reported_by.username', read_only=True)
+    assigned_department = serializers.CharField(source='assigned_department.name', read_only=True, allow_null=True)
+    assigned_to = serializers.CharField(source='assigned_to.username', read_only=True, allow_null=True)
     location_coordinates = serializers.ReadOnlyField()
+    image = serializers.SerializerMethodField()
     
     class Meta:
         model = Report
@@ -42,17 +133,27 @@ class ReportListSerializer(serializers.ModelSerializer):
             'address', 'reported_by', 'assigned_department', 'assigned_to',
             'created_at', 'updated_at', 'resolved_at', 'days_since_submitted', 'image'
         ]
+    
+    def get_fields(self):
+        # Build the model field map once per class; each instance still gets
+        # its own unbound copies, just as DRF copies the declared fields
+        cls = type(self)
+        if '_cached_fields' not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        return copy.deepcopy(cls._cached_fields)
+    
+    def get_image(self, obj):
+        # Join the media path directly instead of asking storage for a URL per row
+        if not obj.image:
+            return None
+        return f'{settings.MEDIA_URL}{obj.image.name}'
 
 
-class ReportDetailSerializer(serializers.ModelSerializer):
+class ReportDetailSerializer(ReportDisplayFieldsMixin, serializers.ModelSerializer):
     """Full serializer for report details"""
-    reported_by = UserSerializer(read_only=True)
+    reported_by = UserLiteSerializer(read_only=True)
     assigned_department = DepartmentSerializer(read_only=True)
-    assigned_to = UserSerializer(read_only=True)
-    category_display = serializers.CharField(source='get_category_display', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
-    priority_display = serializers.CharField(source='get_priority_display', read_only=True)
-    days_since_submitted = serializers.IntegerField(read_only=True)
+    assigned_to = UserLiteSerializer(read_only=True)
     location_coordinates = serializers.ReadOnlyField()
     
     class Meta:
@@ -80,6 +181,12 @@ class ReportCreateSerializer(serializers.ModelSerializer):
             'longitude': {'required': True}
         }
     
+    def validate_image(self, value):
+        """Reject oversized uploads before the report is saved"""
+        if value and value.size > settings.REPORT_IMAGE_MAX_SIZE:
+            raise serializers.ValidationError("Image too large.")
+        return value
+    
     def create(self, validated_data):
         # Automatically set the reporting user
         validated_data['reported_by'] = self.context['request'].user
@@ -88,16 +195,17 @@ class ReportCreateSerializer(serializers.ModelSerializer):
 
 class ReportUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating report status and assignment (admin only)"""
+    # Restrict the lookup itself to admins so no separate role check is needed
+    assigned_to = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.filter(role=User.ADMIN),
+        allow_null=True,
+        required=False,
+        error_messages={'does_not_exist': 'Reports can only be assigned to admin users.'}
+    )
     
     class Meta:
         model = Report
         fields = ['status', 'assigned_department', 'assigned_to', 'priority']
-        
-    def validate_assigned_to(self, value):
-        """Ensure assigned_to user is an admin"""
-        if value and not value.is_admin():
-            raise serializers.ValidationError("Reports can only be assigned to admin users.")
-        return value
     
     def update(self, instance, validated_data):
         # If status is being changed to resolved, set resolved_at timestamp
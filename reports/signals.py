@@ -0,0 +1,16 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Report
+
+# Cached payload of ReportViewSet.analytics
+ANALYTICS_CACHE_KEY = 'reports:analytics:v1'
+ANALYTICS_CACHE_TIMEOUT = 120
+
+
+@receiver(post_save, sender=Report)
+@receiver(post_delete, sender=Report)
+def invalidate_analytics_cache(sender, **kwargs):
+    """Drop the cached analytics payload whenever a report changes"""
+    cache.delete(ANALYTICS_CACHE_KEY)
@@ -1,3 +1,214 @@
-from django.test import TestCase
+import datetime
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Report, User
+from .signals import ANALYTICS_CACHE_KEY
+from .views import CachedSimpleMetadata
+
+
+class BulkRegisterAPITests(APITestCase):
+    """Tests for the admin-only bulk citizen registration endpoint"""
+
+    url = reverse('bulk_register_api')
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='pw12345!', role=User.ADMIN)
+        self.citizen = User.objects.create_user(username='citizen', password='pw12345!')
+        self.client.force_authenticate(self.admin)
+
+    def account(self, username, **extra):
+        return {'username': username, 'email': f'{username}@example.com', 'password': 'pw12345!', **extra}
+
+    def test_admin_creates_users(self):
+        response = self.client.post(self.url, [self.account('alice'), self.account('bob')], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(User.objects.filter(username__in=['alice', 'bob']).count(), 2)
+
+    def test_citizen_is_forbidden(self):
+        self.client.force_authenticate(self.citizen)
+        response = self.client.post(self.url, [self.account('alice')], format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(User.objects.filter(username='alice').exists())
+
+    def test_existing_username_is_rejected(self):
+        response = self.client.post(self.url, [self.account('citizen'), self.account('alice')], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(username='alice').exists())
+
+    def test_duplicate_username_in_payload_is_rejected(self):
+        response = self.client.post(self.url, [self.account('alice'), self.account('alice')], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(username='alice').exists())
+
+    def test_lookalike_username_in_payload_is_rejected(self):
+        # 'ａlice' (fullwidth a) normalizes to 'alice' under NFKC
+        response = self.client.post(self.url, [self.account('alice'), self.account('ａlice')], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(username='alice').exists())
+
+    def test_lookalike_of_existing_username_is_rejected(self):
+        response = self.client.post(self.url, [self.account('ｃitizen')], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(User.objects.filter(username='citizen').count(), 1)
+
+    def test_email_is_normalized(self):
+        response = self.client.post(self.url, [self.account('alice', email='Alice@EXAMPLE.com')], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(User.objects.get(username='alice').email, 'Alice@example.com')
+
+    def test_passwords_are_hashed(self):
+        self.client.post(self.url, [self.account('alice')], format='json')
+        user = User.objects.get(username='alice')
+        self.assertNotEqual(user.password, 'pw12345!')
+        self.assertTrue(user.check_password('pw12345!'))
+
+    def test_role_is_forced_to_citizen(self):
+        response = self.client.post(self.url, [self.account('alice', role=User.ADMIN)], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(User.objects.get(username='alice').role, User.CITIZEN)
+
+
+class RoleRedirectTests(APITestCase):
+    """Tests for the citizen_only/admin_only page decorators"""
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='pw12345!', role=User.ADMIN)
+        self.citizen = User.objects.create_user(username='citizen', password='pw12345!')
+
+    def test_admin_is_sent_away_from_citizen_pages(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('citizen_dashboard'))
+        self.assertRedirects(response, reverse('admin_dashboard'), fetch_redirect_response=False)
+
+    def test_citizen_is_sent_away_from_admin_pages(self):
+        self.client.force_login(self.citizen)
+        response = self.client.get(reverse('admin_dashboard'))
+        self.assertRedirects(response, reverse('citizen_dashboard'), fetch_redirect_response=False)
+
+    def test_matching_role_sees_page(self):
+        self.client.force_login(self.citizen)
+        self.assertEqual(self.client.get(reverse('citizen_dashboard')).status_code, status.HTTP_200_OK)
+
+
+class ReportMetadataTests(APITestCase):
+    """Tests for the cached OPTIONS metadata on ReportViewSet"""
+
+    def setUp(self):
+        CachedSimpleMetadata._cache.clear()
+        self.admin = User.objects.create_user(username='admin', password='pw12345!', role=User.ADMIN)
+        self.client.force_authenticate(self.admin)
+
+    def test_list_and_extra_action_keep_separate_metadata(self):
+        analytics = self.client.options(reverse('report-analytics'))
+        listing = self.client.options(reverse('report-list'))
+        analytics_again = self.client.options(reverse('report-analytics'))
+
+        self.assertEqual(analytics.data['name'], 'Analytics')
+        self.assertNotIn('POST', analytics.data.get('actions', {}))
+        self.assertEqual(listing.data['name'], 'Report List')
+        self.assertIn('POST', listing.data['actions'])
+        self.assertEqual(analytics_again.data, analytics.data)
+
+
+class AnalyticsAPITests(APITestCase):
+    """Tests for the cached admin analytics endpoint"""
+
+    url = reverse('report-analytics')
+    now = datetime.datetime(2025, 2, 15, 12, 0, tzinfo=datetime.timezone.utc)
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username='admin', password='pw12345!', role=User.ADMIN)
+        self.citizen = User.objects.create_user(username='citizen', password='pw12345!')
+        self.client.force_authenticate(self.admin)
+
+    def create_report(self, created_at, category='pothole', latitude=12.9, longitude=77.5, **extra):
+        report = Report.objects.create(
+            title='Report', description='Details', category=category,
+            latitude=latitude, longitude=longitude, reported_by=self.citizen, **extra
+        )
+        # created_at is auto_now_add, so backdate it with an update
+        Report.objects.filter(pk=report.pk).update(created_at=created_at)
+        return report
+
+    def get_analytics(self):
+        with mock.patch('django.utils.timezone.now', return_value=self.now):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_monthly_trends_cross_year_boundary(self):
+        self.create_report(datetime.datetime(2024, 8, 31, tzinfo=datetime.timezone.utc))
+        self.create_report(datetime.datetime(2024, 9, 1, tzinfo=datetime.timezone.utc))
+        self.create_report(datetime.datetime(2024, 12, 5, tzinfo=datetime.timezone.utc))
+        self.create_report(datetime.datetime(2024, 12, 31, 23, tzinfo=datetime.timezone.utc))
+        self.create_report(datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc))
+        self.create_report(datetime.datetime(2025, 2, 10, tzinfo=datetime.timezone.utc))
+
+        data = self.get_analytics()
+        self.assertEqual(data['monthly_trends'], [
+            {'month': '2024-09', 'count': 1},
+            {'month': '2024-10', 'count': 0},
+            {'month': '2024-11', 'count': 0},
+            {'month': '2024-12', 'count': 2},
+            {'month': '2025-01', 'count': 1},
+            {'month': '2025-02', 'count': 1},
+        ])
+        self.assertEqual(data['total_reports'], 6)
+
+    def test_hotspots_group_nearby_reports(self):
+        created_at = datetime.datetime(2025, 2, 1, tzinfo=datetime.timezone.utc)
+        # Both round to (12.345, 77.1) at three decimal places
+        self.create_report(created_at, category='pothole', latitude=12.3451, longitude=77.1001)
+        self.create_report(created_at, category='trash', latitude=12.3449, longitude=77.0999)
+        self.create_report(created_at, category='pothole', latitude=12.3452, longitude=77.1002)
+        # A lone report elsewhere is not a hotspot
+        self.create_report(created_at, category='water', latitude=13.0, longitude=78.0)
+
+        data = self.get_analytics()
+        self.assertEqual(len(data['hotspots']), 1)
+        hotspot = data['hotspots'][0]
+        self.assertAlmostEqual(hotspot['latitude'], 12.345)
+        self.assertAlmostEqual(hotspot['longitude'], 77.1)
+        self.assertEqual(hotspot['count'], 3)
+        self.assertEqual(sorted(hotspot['categories']), ['pothole', 'pothole', 'trash'])
+        self.assertEqual(data['reports_by_category'], {'pothole': 2, 'trash': 1, 'water': 1})
+
+    def test_status_counts_and_average_response_time(self):
+        created_at = datetime.datetime(2025, 2, 1, tzinfo=datetime.timezone.utc)
+        self.create_report(created_at, status='resolved', resolved_at=created_at + datetime.timedelta(days=2))
+        self.create_report(created_at, status='resolved', resolved_at=created_at + datetime.timedelta(days=4))
+        self.create_report(created_at)
+
+        data = self.get_analytics()
+        self.assertEqual(data['total_reports'], 3)
+        self.assertEqual(data['reports_by_status'], {'resolved': 2, 'submitted': 1})
+        self.assertAlmostEqual(data['avg_response_time_days'], 3.0)
+
+    def test_no_resolved_reports_gives_zero_response_time(self):
+        self.create_report(datetime.datetime(2025, 2, 1, tzinfo=datetime.timezone.utc))
+        self.assertEqual(self.get_analytics()['avg_response_time_days'], 0)
+
+    def test_report_save_clears_cached_payload(self):
+        report = self.create_report(datetime.datetime(2025, 2, 1, tzinfo=datetime.timezone.utc))
+        self.assertEqual(self.get_analytics()['total_reports'], 1)
+        self.assertIsNotNone(cache.get(ANALYTICS_CACHE_KEY))
+
+        report.status = 'resolved'
+        report.save()
+        self.assertIsNone(cache.get(ANALYTICS_CACHE_KEY))
+        self.assertEqual(self.get_analytics()['reports_by_status'], {'resolved': 1})
+
+    def test_report_delete_clears_cached_payload(self):
+        report = self.create_report(datetime.datetime(2025, 2, 1, tzinfo=datetime.timezone.utc))
+        self.get_analytics()
+
+        report.delete()
+        self.assertIsNone(cache.get(ANALYTICS_CACHE_KEY))
+        self.assertEqual(self.get_analytics()['total_reports'], 0)
@@ -3,28 +3,77 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Count, Avg, Q, F, ExpressionWrapper, DurationField
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.metadata import SimpleMetadata
+from django.db.models import Count, Avg, Q, F, ExpressionWrapper, DurationField, FloatField
+from django.db.models.functions import Now, Round, TruncMonth
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from django.http import JsonResponse
-from datetime import timedelta
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+import logging
 import math
 
-from .models import Report, Department
+from .models import Report, Department, CATEGORY_MAP, PRIORITY_MAP
 from .serializers import (
     ReportListSerializer, ReportDetailSerializer, ReportCreateSerializer,
     ReportUpdateSerializer, DepartmentSerializer, AnalyticsSerializer
 )
-from .permissions import IsOwnerOrAdmin, IsAdminUser
+from .permissions import IsOwnerOrAdmin, IsAdminUser, user_is_admin
+from .signals import ANALYTICS_CACHE_KEY, ANALYTICS_CACHE_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# Accepted values for create_report_session, built once at import
+VALID_CATEGORIES = frozenset(CATEGORY_MAP)
+VALID_PRIORITIES = frozenset(PRIORITY_MAP)
+
+# Report age computed in SQL; the serializers read it as submitted_age
+SUBMITTED_AGE = ExpressionWrapper(Now() - F('created_at'), output_field=DurationField())
+
+# Approximate degrees of latitude per kilometre
+_DEG_PER_KM = 1.0 / 111.0
+
+
+def _bbox(lat, radius_km):
+    """Return degree offsets for radius_km around lat, plus the longitude scale factor"""
+    # Clamp cos(lat) so the longitude span stays finite at the poles
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    dlat = radius_km * _DEG_PER_KM
+    dlng = dlat / cos_lat
+    return dlat, dlng, cos_lat
+
+
+class UserReportsPagination(PageNumberPagination):
+    """Pagination for a citizen's own report history"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class CachedSimpleMetadata(SimpleMetadata):
+    """OPTIONS metadata memoized per view class, route and role for list-level requests"""
+    _cache = {}
+
+    def determine_metadata(self, request, view):
+        # Detail requests run object-level permission checks, so don't share them
+        if (view.lookup_url_kwarg or view.lookup_field) in view.kwargs:
+            return super().determine_metadata(request, view)
+        # Extra actions share the view class and the 'metadata' action, so key on the route too
+        key = (view.__class__, request.resolver_match.view_name, user_is_admin(request))
+        if key not in self._cache:
+            self._cache[key] = super().determine_metadata(request, view)
+        return self._cache[key]
 
 
 class ReportViewSet(viewsets.ModelViewSet):
     """ViewSet for Report CRUD operations with filtering and permissions"""
     
-    queryset = Report.objects.select_related(
-        'reported_by', 'assigned_department', 'assigned_to'
-    ).all()
+    queryset = Report.objects.all()
+    metadata_class = CachedSimpleMetadata
     
     # Filtering and search
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -33,6 +82,25 @@ class ReportViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'updated_at', 'priority']
     ordering = ['-created_at']
     
+    # Columns needed by ReportListSerializer, including the joined display names
+    list_fields = [
+        'id', 'title', 'category', 'status', 'priority', 'latitude', 'longitude',
+        'address', 'image', 'created_at', 'updated_at', 'resolved_at',
+        'reported_by__username', 'assigned_department__name', 'assigned_to__username',
+    ]
+    
+    # Columns needed by ReportDetailSerializer and its embedded user/department
+    detail_fields = [
+        'id', 'title', 'description', 'category', 'status', 'priority',
+        'latitude', 'longitude', 'address', 'image',
+        'created_at', 'updated_at', 'resolved_at',
+        'reported_by__id', 'reported_by__username', 'reported_by__first_name',
+        'reported_by__last_name', 'reported_by__role',
+        'assigned_to__id', 'assigned_to__username', 'assigned_to__first_name',
+        'assigned_to__last_name', 'assigned_to__role',
+        'assigned_department',
+    ]
+    
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
         if self.action == 'create':
@@ -65,8 +133,17 @@ class ReportViewSet(viewsets.ModelViewSet):
         queryset = self.queryset
         user = self.request.user
         
+        # Only load the columns the read serializers render
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_fields)
+        elif self.action == 'retrieve':
+            queryset = queryset.only(*self.detail_fields)
+        
+        # Compute report age in SQL rather than per row during serialization
+        queryset = queryset.annotate(submitted_age=SUBMITTED_AGE)
+        
         # Citizens can only see their own reports by default
-        if not user.is_admin():
+        if not user_is_admin(self.request):
             queryset = queryset.filter(reported_by=user)
         
         # Location-based filtering
@@ -80,66 +157,98 @@ class ReportViewSet(viewsets.ModelViewSet):
                 lng = float(lng)
                 radius = float(radius)
                 # Simple distance filtering (for more accuracy, use PostGIS)
-                lat_range = radius / 111.0  # Approximate km to degree
-                lng_range = radius / (111.0 * math.cos(math.radians(lat)))
+                lat_range, lng_range, lng_scale = _bbox(lat, radius)
                 
+                # The bounding box narrows the candidates via the coordinate
+                # index, then an equirectangular distance check in SQL drops
+                # the corners that lie outside the radius
                 queryset = queryset.filter(
                     latitude__gte=lat - lat_range,
                     latitude__lte=lat + lat_range,
                     longitude__gte=lng - lng_range,
                     longitude__lte=lng + lng_range
-                )
+                ).alias(
+                    distance_sq=ExpressionWrapper(
+                        (F('latitude') - lat) * (F('latitude') - lat) +
+                        (F('longitude') - lng) * (F('longitude') - lng) * (lng_scale * lng_scale),
+                        output_field=FloatField()
+                    )
+                ).filter(distance_sq__lte=lat_range * lat_range)
             except (ValueError, TypeError):
                 pass
         
         return queryset
     
+    def list(self, request, *args, **kwargs):
+        """List reports, streaming an unpaginated JSON array when ?stream=1 is passed"""
+        if request.query_params.get('stream') != '1':
+            return super().list(request, *args, **kwargs)
+        
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        encoder = JSONEncoder(separators=(',', ':'))
+        
+        def stream():
+            # Serialize in chunks so only a bounded number of rows is held in memory
+            yield '['
+            separator = ''
+            for report in queryset.iterator(chunk_size=500):
+                yield separator + encoder.encode(serializer_class(report, context=context).data)
+                separator = ','
+            yield ']'
+        
+        return StreamingHttpResponse(stream(), content_type='application/json')
+    
     @action(detail=False, methods=['get'], permission_classes=[IsAdminUser])
     def analytics(self, request):
         """Analytics endpoint for admin dashboard"""
+        cached_data = cache.get(ANALYTICS_CACHE_KEY)
+        if cached_data is not None:
+            return Response(cached_data)
         
-        # Basic stats
-        total_reports = Report.objects.count()
-        
-        # Reports by status
-        reports_by_status = dict(
-            Report.objects.values('status').annotate(count=Count('id')).values_list('status', 'count')
+        # Reports by status, with the average response time (days from created
+        # to resolved) computed in the same scan as a filtered aggregate
+        status_rows = Report.objects.values_list('status').annotate(
+            count=Count('id'),
+            avg_time=Avg(
+                ExpressionWrapper(
+                    F('resolved_at') - F('created_at'), 
+                    output_field=DurationField()
+                ),
+                filter=Q(status='resolved', resolved_at__isnull=False)
+            )
         )
         
+        reports_by_status = {}
+        avg_response_time = None
+        for report_status, count, avg_time in status_rows:
+            reports_by_status[report_status] = count
+            if report_status == 'resolved':
+                avg_response_time = avg_time
+        avg_response_time_days = (avg_response_time.total_seconds() / 86400) if avg_response_time else 0
+        
+        # Basic stats - every report has exactly one status
+        total_reports = sum(reports_by_status.values())
+        
         # Reports by category
         reports_by_category = dict(
-            Report.objects.values('category').annotate(count=Count('id')).values_list('category', 'count')
-        )
-        
-        # Average response time (days from created to resolved)
-        resolved_reports = Report.objects.filter(
-            status='resolved', 
-            resolved_at__isnull=False
+            Report.objects.values_list('category').annotate(count=Count('id'))
         )
         
-        if resolved_reports.exists():
-            avg_response_time = resolved_reports.aggregate(
-                avg_time=Avg(
-                    ExpressionWrapper(
-                        F('resolved_at') - F('created_at'), 
-                        output_field=DurationField()
-                    )
-                )
-            )['avg_time']
-            avg_response_time_days = (avg_response_time.total_seconds() / 86400) if avg_response_time else 0
-        else:
-            avg_response_time_days = 0
-        
         # Hotspots - areas with multiple reports
-        hotspots = []
-        reports_with_coords = Report.objects.exclude(latitude__isnull=True, longitude__isnull=True)
+        # Cluster in the database by rounding to 3 decimal places (~100m precision),
+        # grouping per cell and category so this works without ArrayAgg
+        hotspot_cells = Report.objects.exclude(
+            latitude__isnull=True, longitude__isnull=True
+        ).annotate(
+            lat_key=Round('latitude', 3),
+            lng_key=Round('longitude', 3)
+        ).values_list('lat_key', 'lng_key', 'category').annotate(count=Count('id'))
         
-        # Simple clustering by rounding coordinates (for demo purposes)
+        # Stream the grouped rows; with sparse reports there can be nearly one per report
         hotspot_data = {}
-        for report in reports_with_coords:
-            # Round to 3 decimal places (~100m precision)
-            lat_key = round(float(report.latitude), 3)
-            lng_key = round(float(report.longitude), 3)
+        for lat_key, lng_key, category, count in hotspot_cells.iterator(chunk_size=5000):
             coord_key = (lat_key, lng_key)
             
             if coord_key not in hotspot_data:
@@ -150,8 +259,8 @@ class ReportViewSet(viewsets.ModelViewSet):
                     'categories': []
                 }
             
-            hotspot_data[coord_key]['count'] += 1
-            hotspot_data[coord_key]['categories'].append(report.category)
+            hotspot_data[coord_key]['count'] += count
+            hotspot_data[coord_key]['categories'].extend([category] * count)
         
         # Filter hotspots with multiple reports
         hotspots = [
@@ -160,7 +269,9 @@ class ReportViewSet(viewsets.ModelViewSet):
         ]
         
         # Recent activity
-        recent_reports = Report.objects.order_by('-created_at')[:10]
+        recent_reports = Report.objects.select_related(None).select_related('reported_by').only(
+            'id', 'title', 'category', 'status', 'created_at', 'reported_by__username'
+        ).order_by('-created_at')[:10]
         recent_activity = [
             {
                 'id': report.id,
@@ -173,23 +284,30 @@ class ReportViewSet(viewsets.ModelViewSet):
             for report in recent_reports
         ]
         
-        # Monthly trends
-        now = timezone.now()
-        monthly_trends = []
-        for i in range(6):  # Last 6 months
-            month_start = now.replace(day=1) - timedelta(days=30 * i)
-            month_end = month_start.replace(day=28) + timedelta(days=4)
-            month_end = month_end - timedelta(days=month_end.day)
-            
-            month_reports = Report.objects.filter(
-                created_at__gte=month_start,
-                created_at__lte=month_end
-            ).count()
-            
-            monthly_trends.insert(0, {
-                'month': month_start.strftime('%Y-%m'),
-                'count': month_reports
-            })
+        # Monthly trends - counts for the last 6 calendar months in one query
+        now = timezone.localtime()
+        year, month = now.year, now.month
+        months = []
+        for _ in range(6):
+            months.insert(0, (year, month))
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        month_keys = [f'{year:04d}-{month:02d}' for year, month in months]
+        first_month_start = now.replace(
+            year=months[0][0], month=months[0][1], day=1,
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        
+        monthly_counts = {
+            row['month'].strftime('%Y-%m'): row['count']
+            for row in Report.objects.filter(created_at__gte=first_month_start)
+            .annotate(month=TruncMonth('created_at'))
+            .values('month')
+            .annotate(count=Count('id'))
+        }
+        monthly_trends = [
+            {'month': key, 'count': monthly_counts.get(key, 0)}
+            for key in month_keys
+        ]
         
         analytics_data = {
             'total_reports': total_reports,
@@ -202,6 +320,7 @@ class ReportViewSet(viewsets.ModelViewSet):
         }
         
         serializer = AnalyticsSerializer(analytics_data)
+        cache.set(ANALYTICS_CACHE_KEY, serializer.data, ANALYTICS_CACHE_TIMEOUT)
         return Response(serializer.data)
 
 
@@ -226,8 +345,6 @@ def create_report_session(request):
         return JsonResponse({'error': 'Authentication required'}, status=401)
     
     try:
-        import json
-        
         # Get form data
         title = request.POST.get('title')
         description = request.POST.get('description')
@@ -238,17 +355,22 @@ def create_report_session(request):
         priority = request.POST.get('priority', 'medium')
         image = request.FILES.get('image')
         
-        print(f"Received data: title={title}, category={category}, lat={latitude}, lng={longitude}")
+        logger.debug(
+            "Received data: title=%s, category=%s, lat=%s, lng=%s",
+            title, category, latitude, longitude
+        )
         
         # Validate required fields
-        if not all([title, description, category, address, latitude, longitude]):
-            missing_fields = []
-            if not title: missing_fields.append('title')
-            if not description: missing_fields.append('description')
-            if not category: missing_fields.append('category')
-            if not address: missing_fields.append('address')
-            if not latitude: missing_fields.append('latitude')
-            if not longitude: missing_fields.append('longitude')
+        required_fields = (
+            ('title', title),
+            ('description', description),
+            ('category', category),
+            ('address', address),
+            ('latitude', latitude),
+            ('longitude', longitude),
+        )
+        missing_fields = [name for name, value in required_fields if not value]
+        if missing_fields:
             return JsonResponse({
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
             }, status=400)
@@ -265,15 +387,17 @@ def create_report_session(request):
             return JsonResponse({'error': 'Invalid coordinate values'}, status=400)
         
         # Validate category
-        valid_categories = ['pothole', 'trash', 'streetlight', 'water', 'drainage', 'road', 'other']
-        if category not in valid_categories:
+        if category not in VALID_CATEGORIES:
             return JsonResponse({'error': 'Invalid category'}, status=400)
         
         # Validate priority
-        valid_priorities = ['low', 'medium', 'high', 'urgent']
-        if priority not in valid_priorities:
+        if priority not in VALID_PRIORITIES:
             priority = 'medium'
         
+        # Reject oversized images before anything is stored
+        if image and image.size > settings.REPORT_IMAGE_MAX_SIZE:
+            return JsonResponse({'error': 'Image too large'}, status=413)
+        
         # Create report
         report = Report.objects.create(
             title=title,
@@ -287,7 +411,7 @@ def create_report_session(request):
             image=image
         )
         
-        print(f"Report created successfully: ID={report.id}")
+        logger.debug("Report created successfully: ID=%s", report.id)
         
         return JsonResponse({
             'id': report.id,
@@ -295,9 +419,7 @@ def create_report_session(request):
         }, status=201)
         
     except Exception as e:
-        import traceback
-        print(f"Error creating report: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error creating report")
         return JsonResponse({'error': str(e)}, status=500)
 
 
@@ -307,6 +429,12 @@ def get_user_reports(request):
     if not request.user.is_authenticated:
         return Response({'error': 'Authentication required'}, status=401)
     
-    reports = Report.objects.filter(reported_by=request.user).order_by('-created_at')
-    serializer = ReportListSerializer(reports, many=True)
-    return Response(serializer.data)
\ No newline at end of file
+    # The Report manager already joins the relations the serializer reads;
+    # load only the list columns and compute the age in SQL as the viewset does
+    reports = Report.objects.filter(reported_by=request.user).only(
+        *ReportViewSet.list_fields
+    ).annotate(submitted_age=SUBMITTED_AGE).order_by('-created_at')
+    paginator = UserReportsPagination()
+    page = paginator.paginate_queryset(reports, request)
+    serializer = ReportListSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
\ No newline at end of file
@@ -38,19 +38,26 @@ class CitizenDashboard {
 
     async loadReports() {
         try {
-            const response = await fetch('/api/reports/user/', {
-                method: 'GET',
-                headers: {
-                    'X-CSRFToken': this.getCookie('csrftoken')
+            // The endpoint is paginated; follow the next links to load every page
+            const reports = [];
+            let url = '/api/reports/user/?page_size=100';
+            while (url) {
+                const response = await fetch(url, {
+                    method: 'GET',
+                    headers: {
+                        'X-CSRFToken': this.getCookie('csrftoken')
+                    }
+                });
+                
+                if (!response.ok) {
+                    throw new Error('Failed to load reports');
                 }
-            });
-            
-            if (!response.ok) {
-                throw new Error('Failed to load reports');
+                
+                const data = await response.json();
+                reports.push(...data.results);
+                url = data.next;
             }
-            
-            const data = await response.json();
-            this.reports = data;
+            this.reports = reports;
             this.updateStats();
             this.applyFilters();
             